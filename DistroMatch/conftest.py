@@ -0,0 +1 @@
+# Lets the tests import the app's top-level packages (engine, scanner)
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+from bisect import bisect_left, bisect_right
+from .scoring import DATA_PATH, load_distros, compile_scenarios
+
+# Numeric fields indexed for range filters, with the defaults scoring uses
+NUMERIC_FIELDS = {
+    "stability": 7,
+    "performance": 7,
+    "ram_min": 2,
+    "ram_optimal": 4
+}
+
+_cache = {"mtime": None, "catalog": None}
+
+
+# ---------------------------------------------------------
+# Catalog + Inverted Indexes
+# ---------------------------------------------------------
+# Candidate sets are plain ints used as bitsets: bit i is set
+# when the i-th distro (in catalog order) is part of the set.
+class Catalog:
+    def __init__(self, distros: dict):
+        self.distros = distros
+        # Order is part of the version: ranking ties are broken by catalog order
+        self.version = hashlib.sha256(json.dumps(distros).encode("utf-8")).hexdigest()[:16]
+        self.ids = list(distros)
+        self.all = (1 << len(self.ids)) - 1
+
+        self.by_id = {}
+        self.by_category = {}
+        self.by_desktop = {}
+        self.by_desktop_env = {}
+        self.numeric = {}
+        self._scenarios = {}
+
+        for i, (key, distro) in enumerate(distros.items()):
+            bit = 1 << i
+            self.by_id[key] = bit
+
+            for c in distro.get("category", []):
+                c = c.lower()
+                self.by_category[c] = self.by_category.get(c, 0) | bit
+
+            # Exact desktop string ("kde/gnome") and each desktop it ships ("kde", "gnome")
+            desktop = distro.get("desktop", "").lower()
+            self.by_desktop[desktop] = self.by_desktop.get(desktop, 0) | bit
+            for env in desktop.split("/"):
+                env = env.strip()
+                self.by_desktop_env[env] = self.by_desktop_env.get(env, 0) | bit
+
+        # Sorted value arrays + suffix bitsets: everything >= values[j] is suffix[j]
+        for field, default in NUMERIC_FIELDS.items():
+            pairs = sorted(
+                (float(distro.get(field, default)), i)
+                for i, distro in enumerate(distros.values())
+            )
+            values = [v for v, _ in pairs]
+            suffix = [0] * (len(pairs) + 1)
+            for j in range(len(pairs) - 1, -1, -1):
+                suffix[j] = suffix[j + 1] | (1 << pairs[j][1])
+            self.numeric[field] = (values, suffix)
+
+    # --- Index lookups ---
+    def category(self, name: str) -> int:
+        return self.by_category.get(name.lower(), 0)
+
+    def desktop(self, name: str) -> int:
+        return self.by_desktop.get(name.lower(), 0)
+
+    def desktop_env(self, name: str) -> int:
+        return self.by_desktop_env.get(name.lower(), 0)
+
+    def at_least(self, field: str, value: float) -> int:
+        values, suffix = self.numeric[field]
+        return suffix[bisect_left(values, float(value))]
+
+    def at_most(self, field: str, value: float) -> int:
+        values, suffix = self.numeric[field]
+        return self.all & ~suffix[bisect_right(values, float(value))]
+
+    def ids_in(self, bits: int) -> list:
+        ids = []
+        while bits:
+            low = bits & -bits
+            ids.append(self.ids[low.bit_length() - 1])
+            bits ^= low
+        return ids
+
+    # --- Compiled scenario components (see scoring.compile_scenarios) ---
+    # Built once per (usecases, skill_levels) and kept for the catalog's lifetime
+    def scenarios(self, usecases: list, skill_levels: list) -> dict:
+        key = (tuple(usecases), tuple(skill_levels))
+        if key not in self._scenarios:
+            self._scenarios[key] = {
+                distro_id: compile_scenarios(distro, usecases, skill_levels)
+                for distro_id, distro in self.distros.items()
+            }
+        return self._scenarios[key]
+
+    # --- Hard exclusion rules ---
+    def eligible(self, usecase: str) -> int:
+        usecase = usecase.lower()
+        bits = self.all
+
+        # Work + Browsing should NEVER show gaming distros
+        if usecase in ["work", "browsing"]:
+            bits &= ~self.category("gaming")
+
+        # Browsing should avoid heavy desktops unless lightweight
+        if usecase == "browsing":
+            heavy = self.desktop("gnome") | self.desktop("cosmic")
+            bits &= ~(heavy & ~self.category("lightweight"))
+
+        return bits
+
+    # --- User-facing filters ---
+    # desktop / category: name or list of names (any match)
+    # exclude: list of distro ids
+    # min_<field> / max_<field>: bounds on a NUMERIC_FIELDS entry
+    def apply_filters(self, bits: int, filters: dict) -> int:
+        for name, value in (filters or {}).items():
+            if name == "desktop":
+                bits &= self._any(self.desktop_env, value)
+            elif name == "category":
+                bits &= self._any(self.category, value)
+            elif name == "exclude":
+                bits &= ~self._any(lambda k: self.by_id.get(k, 0), value)
+            elif name.startswith("min_") and name[4:] in self.numeric:
+                bits &= self.at_least(name[4:], value)
+            elif name.startswith("max_") and name[4:] in self.numeric:
+                bits &= self.at_most(name[4:], value)
+            else:
+                raise ValueError(f"Unknown filter: {name}")
+        return bits
+
+    def select(self, usecase: str, filters: dict = None) -> int:
+        return self.apply_filters(self.eligible(usecase), filters)
+
+    @staticmethod
+    def _any(lookup, value) -> int:
+        if isinstance(value, str):
+            value = [value]
+        bits = 0
+        for v in value:
+            bits |= lookup(v)
+        return bits
+
+
+# ---------------------------------------------------------
+# Cached Catalog Loading
+# ---------------------------------------------------------
+# Indexes are rebuilt only when distros.json changes on disk.
+def load_catalog() -> Catalog:
+    mtime = os.stat(DATA_PATH).st_mtime_ns
+    if _cache["catalog"] is None or _cache["mtime"] != mtime:
+        _cache["catalog"] = Catalog(load_distros())
+        _cache["mtime"] = mtime
+    return _cache["catalog"]
@@ -0,0 +1,249 @@
+import argparse
+import json
+import multiprocessing
+import queue
+import socket
+import struct
+import threading
+from .ranking import get_recommendations
+
+FRAME = struct.Struct(">I")
+
+
+# ---------------------------------------------------------
+# Framing: 4-byte big-endian length + UTF-8 JSON
+# ---------------------------------------------------------
+def send_message(sock: socket.socket, message: dict):
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(FRAME.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    size = FRAME.unpack(_recv_exact(sock, FRAME.size))[0]
+    return json.loads(_recv_exact(sock, size))
+
+
+# ---------------------------------------------------------
+# Worker
+# ---------------------------------------------------------
+# Request:  {"unit": n, "usecase", "skill_level", "filters", "machines": [[id, hardware], ...]}
+# Reply:    {"unit": n, "results": [[id, result], ...]}
+#           or {"unit": n, "error": "..."} when scoring the unit raised
+# {"op": "shutdown"} stops the worker.
+def _handle_connection(conn: socket.socket, stop: threading.Event):
+    with conn:
+        while True:
+            try:
+                message = recv_message(conn)
+            except (ConnectionError, OSError):
+                return
+
+            if message.get("op") == "shutdown":
+                stop.set()
+                return
+
+            # Bad input must not look like a dead worker to the coordinator
+            try:
+                results = [
+                    [machine_id, get_recommendations(
+                        hardware, message["usecase"], message["skill_level"], message.get("filters")
+                    )]
+                    for machine_id, hardware in message["machines"]
+                ]
+                reply = {"unit": message.get("unit"), "results": results}
+            except Exception as e:
+                reply = {"unit": message.get("unit"), "error": f"{type(e).__name__}: {e}"}
+
+            try:
+                send_message(conn, reply)
+            except OSError:
+                return
+
+
+def serve_worker(host: str = "127.0.0.1", port: int = 0, ready=None):
+    stop = threading.Event()
+
+    with socket.create_server((host, port)) as server:
+        if ready is not None:
+            ready.send(server.getsockname()[1])
+            ready.close()
+
+        server.settimeout(0.5)
+        while not stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            threading.Thread(target=_handle_connection, args=(conn, stop), daemon=True).start()
+
+
+# ---------------------------------------------------------
+# Local Workers (one process each, on localhost ports)
+# ---------------------------------------------------------
+def start_local_workers(count: int, host: str = "127.0.0.1") -> tuple:
+    processes = []
+    addresses = []
+
+    for _ in range(count):
+        parent, child = multiprocessing.Pipe()
+        proc = multiprocessing.Process(target=serve_worker, args=(host, 0, child), daemon=True)
+        proc.start()
+        child.close()
+        addresses.append((host, parent.recv()))
+        parent.close()
+        processes.append(proc)
+
+    return processes, addresses
+
+
+def stop_local_workers(processes: list, addresses: list):
+    for address in addresses:
+        try:
+            with socket.create_connection(address, timeout=1) as sock:
+                send_message(sock, {"op": "shutdown"})
+        except OSError:
+            pass
+    for proc in processes:
+        proc.join(timeout=2)
+        if proc.is_alive():
+            proc.terminate()
+
+
+# ---------------------------------------------------------
+# Coordinator
+# ---------------------------------------------------------
+# Splits the inventory into work units on a shared queue; one thread per
+# worker pulls the next unit as soon as its worker is free, so faster
+# workers take more of the load. A unit whose worker dies or times out is
+# put back for the remaining workers (up to max_attempts), and results are
+# merged back into the inventory's original order. A unit the worker
+# rejected (e.g. an unknown filter) fails the whole run with that error.
+def run_cluster(machines: dict, workers: list, usecase: str, skill_level: str,
+                filters: dict = None, unit_size: int = 64, max_attempts: int = 3,
+                timeout: float = 60) -> dict:
+    if not workers:
+        raise ValueError("run_cluster needs at least one worker address")
+
+    items = list(machines.items())
+    units = [items[i:i + unit_size] for i in range(0, len(items), unit_size)]
+
+    pending = queue.Queue()
+    for index in range(len(units)):
+        pending.put(index)
+
+    results = [None] * len(units)
+    attempts = [0] * len(units)
+    lock = threading.Lock()
+    finished = threading.Event()
+    state = {"remaining": len(units), "alive": len(workers), "error": None}
+    stats = {"units": len(units), "retried": 0, "dead_workers": []}
+
+    if not units:
+        finished.set()
+
+    def fail(message):
+        state["error"] = message
+        finished.set()
+
+    def drive(address):
+        sock = None
+        index = None
+        try:
+            sock = socket.create_connection(address, timeout=timeout)
+            while not finished.is_set():
+                try:
+                    index = pending.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                send_message(sock, {
+                    "unit": index,
+                    "usecase": usecase,
+                    "skill_level": skill_level,
+                    "filters": filters,
+                    "machines": units[index]
+                })
+                reply = recv_message(sock)
+
+                if "error" in reply:
+                    index = None
+                    fail(f"Work unit {reply.get('unit')} failed: {reply['error']}")
+                    return
+
+                with lock:
+                    results[index] = reply["results"]
+                    index = None
+                    state["remaining"] -= 1
+                    if state["remaining"] == 0:
+                        finished.set()
+            return
+        except (OSError, ConnectionError, ValueError):
+            pass
+        except Exception as e:
+            # Anything else is a coordinator-side bug; never leave run_cluster waiting
+            fail(f"Coordinator error talking to {address[0]}:{address[1]}: {type(e).__name__}: {e}")
+            return
+        finally:
+            if sock is not None:
+                sock.close()
+
+        # Worker is gone (or was never reachable): hand its unit back to the others
+        with lock:
+            stats["dead_workers"].append(list(address))
+            state["alive"] -= 1
+            if index is not None:
+                attempts[index] += 1
+                if attempts[index] >= max_attempts:
+                    fail(f"Work unit {index} failed on {attempts[index]} workers")
+                else:
+                    stats["retried"] += 1
+                    pending.put(index)
+            if state["alive"] == 0 and state["remaining"] > 0:
+                fail("All scoring workers died before the inventory was finished")
+
+    threads = [threading.Thread(target=drive, args=(tuple(a),), daemon=True) for a in workers]
+    for t in threads:
+        t.start()
+    # Every exit path of drive() either finishes, fails or hands off, but
+    # never rely on that alone: stop once no driver thread is left
+    while not finished.wait(0.5):
+        if not any(t.is_alive() for t in threads):
+            fail("Scoring workers exited before the inventory was finished")
+    for t in threads:
+        t.join()
+
+    if state["error"]:
+        raise RuntimeError(state["error"])
+
+    merged = {}
+    for unit_results in results:
+        for machine_id, result in unit_results:
+            merged[machine_id] = result
+
+    return {"results": merged, **stats}
+
+
+# ---------------------------------------------------------
+# CLI: run a worker on this host
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Run a DistroMatch scoring worker.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9750)
+    args = parser.parse_args()
+    serve_worker(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import argparse
+import json
+from .catalog import Catalog
+from .ranking import rank_distros
+from .scoring import compute_final_score
+from .store import ResultStore, inputs_version
+
+
+# ---------------------------------------------------------
+# Catalog Diff
+# ---------------------------------------------------------
+def diff_catalogs(old: dict, new: dict) -> dict:
+    return {
+        "added": [k for k in new if k not in old],
+        "removed": [k for k in old if k not in new],
+        "changed": [k for k in new if k in old and new[k] != old[k]]
+    }
+
+
+# Ties are broken by catalog order, so if unchanged distros swap places
+# only a full rerun gives the exact new order
+def _order_changed(old: dict, new: dict) -> bool:
+    common_old = [k for k in old if k in new]
+    common_new = [k for k in new if k in old]
+    return common_old != common_new
+
+
+def _top_entry(key: str, distro: dict, score: float) -> dict:
+    return {"id": key, "name": distro.get("name", key), "score": score}
+
+
+# ---------------------------------------------------------
+# Delta Scoring
+# ---------------------------------------------------------
+# Scores are per-distro independent, so a machine's top-k can only change
+# if one of its current top-k distros was edited/removed, or an edited/added
+# distro now beats its k-th score. Only those distros are scored; machines
+# hitting an ambiguous case (a top-k entry touched, an exact tie at the
+# threshold, or a reordered catalog) fall back to a full rerun.
+#
+# inventory: {machine_id: {"hardware": ..., "top_3": [{"id", "name", "score"}, ...] or None}}
+# where each stored list is that machine's top-k under the old catalog. A
+# list shorter than top_k is only trusted when the new catalog can't fill
+# top_k either; otherwise it may have been stored with a smaller k, and
+# the machine is rescored in full.
+def catalog_impact(old: dict, new: dict, inventory: dict, usecase: str, skill_level: str,
+                   filters: dict = None, top_k: int = 3) -> dict:
+    diff = diff_catalogs(old, new)
+    old_catalog = Catalog(old)
+    new_catalog = Catalog(new)
+
+    touched = set(diff["changed"]) | set(diff["removed"])
+    eligible = new_catalog.select(usecase, filters)
+    candidates = [
+        k for k in diff["changed"] + diff["added"]
+        if eligible & new_catalog.by_id[k]
+    ]
+    eligible_count = bin(eligible).count("1")
+    position = {k: i for i, k in enumerate(new_catalog.ids)}
+    full_only = _order_changed(old, new)
+
+    changes = {}
+    delta_scored = 0
+    rescored = 0
+
+    for machine_id, entry in inventory.items():
+        hardware = entry["hardware"]
+        before = entry.get("top_3")
+        if before is not None:
+            before = before[:top_k]
+        else:
+            before = [
+                _top_entry(d["id"], d["data"], d["score"])
+                for d in rank_distros(hardware, usecase, skill_level, filters, old_catalog)[:top_k]
+            ]
+
+        short = len(before) < top_k and eligible_count >= top_k
+
+        after = None
+        if not full_only and not short and not any(d["id"] in touched for d in before):
+            threshold = before[-1]["score"] if len(before) >= top_k else None
+            entrants = []
+            tie = False
+
+            for key in candidates:
+                score = compute_final_score(new_catalog.distros[key], hardware, usecase, skill_level)
+                if threshold is None or score > threshold:
+                    entrants.append(_top_entry(key, new_catalog.distros[key], score))
+                elif score == threshold:
+                    tie = True
+                    break
+
+            if not tie:
+                merged = before + entrants
+                merged.sort(key=lambda x: (-x["score"], position[x["id"]]))
+                after = merged[:top_k]
+                delta_scored += 1
+
+        if after is None:
+            after = [
+                _top_entry(d["id"], d["data"], d["score"])
+                for d in rank_distros(hardware, usecase, skill_level, filters, new_catalog)[:top_k]
+            ]
+            rescored += 1
+
+        if after != before:
+            changes[machine_id] = {"before": before, "after": after}
+
+    return {
+        "diff": diff,
+        "changed_machines": changes,
+        "delta_scored": delta_scored,
+        "rescored": rescored
+    }
+
+
+# ---------------------------------------------------------
+# CLI: impact of a catalog edit on a stored fleet
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Report which machines' recommendations change between two catalogs.")
+    parser.add_argument("old_catalog")
+    parser.add_argument("new_catalog")
+    parser.add_argument("--store", default="distromatch_results.db")
+    parser.add_argument("--usecase", required=True)
+    parser.add_argument("--skill", required=True)
+    args = parser.parse_args()
+
+    with open(args.old_catalog, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    with open(args.new_catalog, "r", encoding="utf-8") as f:
+        new = json.load(f)
+
+    store = ResultStore(args.store)
+    inventory = store.inventory(args.usecase, args.skill, "{}", inputs_version(Catalog(old)))
+    store.close()
+
+    report = catalog_impact(old, new, inventory, args.usecase, args.skill)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
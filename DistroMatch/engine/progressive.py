@@ -0,0 +1,142 @@
+from .catalog import load_catalog
+from .ranking import rank_distros
+from .scoring import (
+    HARDWARE_FLAGS, GPU_VENDORS, STORAGE_CLASSES, get_weights, detect_gpu_vendor,
+    ram_band_samples, hardware_score, hardware_intelligence_bonus, usecase_score,
+    skill_score, stability_score, performance_score
+)
+
+# Hardware facts scoring reads; everything else in a scan is ignored here
+FACT_KEYS = ["gpu", "ram", "storage"] + HARDWARE_FLAGS
+
+
+# ---------------------------------------------------------
+# Score Bounds Under Partial Hardware
+# ---------------------------------------------------------
+# Unknown GPU/RAM/storage are bounded by trying every vendor, RAM band and
+# storage class. Unknown flags are bounded per flag, since
+# hardware_intelligence_bonus is a sum of independent per-flag terms.
+def score_bounds(distro: dict, hardware: dict, usecase: str, skill_level: str) -> tuple:
+    weights = get_weights(usecase)
+
+    if "gpu" in hardware:
+        vendors = [detect_gpu_vendor(hardware["gpu"].get("gpu_model", "Unknown GPU"))]
+    else:
+        vendors = GPU_VENDORS
+
+    if "ram" in hardware:
+        try:
+            rams = [float(hardware["ram"].get("total_gb", 0))]
+        except:
+            rams = [0.0]
+    else:
+        rams = ram_band_samples(distro)
+
+    if "storage" in hardware:
+        storages = [hardware["storage"].get("type", "unknown").lower()]
+    else:
+        storages = STORAGE_CLASSES
+
+    hw = [
+        hardware_score(distro, {}, usecase, (vendor, ram, storage))
+        for vendor in vendors for ram in rams for storage in storages
+    ]
+
+    known_flags = {f: hardware[f] for f in HARDWARE_FLAGS if f in hardware}
+    bonus = hardware_intelligence_bonus(distro, known_flags)
+    bonus_lo = bonus_hi = bonus
+    for flag in HARDWARE_FLAGS:
+        if flag not in hardware:
+            term = hardware_intelligence_bonus(distro, {flag: True})
+            bonus_lo += min(0, term)
+            bonus_hi += max(0, term)
+
+    u = usecase_score(distro, usecase)
+    s = skill_score(distro, skill_level, usecase)
+    stab = stability_score(distro)
+    perf = performance_score(distro, usecase)
+
+    # Same summation order as compute_final_score, so the bounds collapse
+    # to its exact score once everything is known
+    def total(h):
+        return (
+            h * weights["hardware"] +
+            u * weights["usecase"] +
+            s * weights["skill"] +
+            stab * weights["stab"] +
+            perf * weights["perf"]
+        )
+
+    low = total(min(hw) + bonus_lo)
+    high = total(max(hw) + bonus_hi)
+    return round(low, 2), round(high, 2)
+
+
+# The top-k order is fixed once each of the first k entries (by lower bound)
+# scores strictly above every entry ranked after it, in rounded scores
+def _order_settled(bounded: list, top_k: int) -> bool:
+    for i in range(min(top_k, len(bounded))):
+        low = bounded[i]["low"]
+        if any(low <= other["high"] for other in bounded[i + 1:]):
+            return False
+    return True
+
+
+# ---------------------------------------------------------
+# Progressive Recommendations
+# ---------------------------------------------------------
+# facts: iterable of (key, value) pairs as they arrive, using scan keys
+# ("gpu", "ram", "storage", "is_laptop", "hidpi", ...), e.g.
+# scanner.scanner.iter_scan(). Yields after every fact:
+#   {"top": [{"id", "name", "low", "high"}, ...], "known", "unknown",
+#    "settled": bool, "final": bool}
+# Stops consuming facts once the unknowns can no longer change the top-k
+# order ("settled"). When every fact is known the scores are exact and
+# identical to get_recommendations. If the stream ends first, a last
+# snapshot is yielded with "final" set and the remaining bounds.
+def progressive_recommendations(facts, usecase: str, skill_level: str,
+                                filters: dict = None, top_k: int = 3):
+    catalog = load_catalog()
+    candidates = catalog.ids_in(catalog.select(usecase, filters))
+    hardware = {}
+
+    def snapshot(final: bool) -> dict:
+        unknown = [k for k in FACT_KEYS if k not in hardware]
+
+        if not unknown:
+            top = [
+                {"id": d["id"], "name": d["name"], "low": d["score"], "high": d["score"]}
+                for d in rank_distros(hardware, usecase, skill_level, filters, catalog)[:top_k]
+            ]
+            return {"top": top, "known": list(hardware), "unknown": [],
+                    "settled": True, "final": True}
+
+        bounded = []
+        for distro_id in candidates:
+            distro = catalog.distros[distro_id]
+            low, high = score_bounds(distro, hardware, usecase, skill_level)
+            bounded.append({"id": distro_id, "name": distro.get("name", distro_id),
+                            "low": low, "high": high})
+        bounded.sort(key=lambda x: (x["low"], x["high"]), reverse=True)
+
+        settled = _order_settled(bounded, top_k)
+        return {"top": bounded[:top_k], "known": list(hardware), "unknown": unknown,
+                "settled": settled, "final": final or settled}
+
+    try:
+        for key, value in facts:
+            if key not in FACT_KEYS:
+                continue
+            hardware[key] = value
+
+            result = snapshot(final=False)
+            yield result
+            if result["final"]:
+                return
+
+        # Stream ended (e.g. probes timed out) with facts still unknown
+        yield snapshot(final=True)
+    finally:
+        # Let the producer cancel probes that are no longer needed
+        if hasattr(facts, "close"):
+            facts.close()
@@ -1,6 +1,10 @@
 import json
+from operator import itemgetter
 from pathlib import Path
-from .scoring import load_distros, compute_final_score
+from .scoring import (
+    USECASES, SKILL_LEVELS, HARDWARE_FLAGS, compute_final_score, score_scenarios, hardware_facts
+)
+from .catalog import load_catalog
 
 # Path to distro profiles (Phase 8)
 PROFILE_PATH = Path(__file__).resolve().parent.parent / "data" / "profiles.json"
@@ -15,28 +19,18 @@ def load_profiles():
 
 
 # ---------------------------------------------------------
-# MAIN RECOMMENDATION FUNCTION
+# RANKING
 # ---------------------------------------------------------
-def get_recommendations(hardware: dict, usecase: str, skill_level: str) -> dict:
-    distros = load_distros()
+# Hard exclusion rules and user filters are resolved on the catalog
+# indexes first, so scoring only runs over eligible candidates.
+def rank_distros(hardware: dict, usecase: str, skill_level: str, filters: dict = None,
+                 catalog=None) -> list:
+    catalog = catalog or load_catalog()
     scored = []
 
-    for key, distro in distros.items():
-
-        # CATEGORY LIST
-        categories = [c.lower() for c in distro.get("category", [])]
-
-        # HARD EXCLUSION RULES
-        # Work + Browsing should NEVER show gaming distros
-        if usecase.lower() in ["work", "browsing"] and "gaming" in categories:
-            continue
+    for key in catalog.ids_in(catalog.select(usecase, filters)):
+        distro = catalog.distros[key]
 
-        # Browsing should avoid heavy desktops unless lightweight
-        if usecase.lower() == "browsing":
-            if distro.get("desktop", "").lower() in ["gnome", "cosmic"] and "lightweight" not in categories:
-                continue
-
-        # Compute score normally
         score = compute_final_score(distro, hardware, usecase, skill_level)
 
         scored.append({
@@ -48,6 +42,16 @@ def get_recommendations(hardware: dict, usecase: str, skill_level: str) -> dict:
 
     # Sort by score descending
     scored.sort(key=lambda x: x["score"], reverse=True)
+    return scored
+
+
+# ---------------------------------------------------------
+# MAIN RECOMMENDATION FUNCTION
+# ---------------------------------------------------------
+# filters: see Catalog.apply_filters, e.g.
+#   {"desktop": "kde", "min_stability": 8, "exclude": ["arch"]}
+def get_recommendations(hardware: dict, usecase: str, skill_level: str, filters: dict = None) -> dict:
+    scored = rank_distros(hardware, usecase, skill_level, filters)
 
     # Top 3
     top_3 = scored[:3] if len(scored) >= 3 else scored
@@ -56,76 +60,124 @@ def get_recommendations(hardware: dict, usecase: str, skill_level: str) -> dict:
     explanation = build_explanation(top_3, hardware, usecase, skill_level)
 
     return {
-        "top_3": [{"name": d["name"], "score": d["score"]} for d in top_3],
+        "top_3": [{"id": d["id"], "name": d["name"], "score": d["score"]} for d in top_3],
         "explanation": explanation
     }
 
 
+# ---------------------------------------------------------
+# MULTI-SCENARIO RECOMMENDATIONS
+# ---------------------------------------------------------
+# Ranks every usecase x skill scenario for one machine in a single call:
+# {usecase: {skill_level: [{"id", "name", "score"}, ...]}}
+def get_recommendation_grid(hardware: dict, usecases: list = None, skill_levels: list = None,
+                            filters: dict = None, top_k: int = 3) -> dict:
+    usecases = usecases or USECASES
+    skill_levels = skill_levels or SKILL_LEVELS
+
+    catalog = load_catalog()
+    compiled = catalog.scenarios(usecases, skill_levels)
+    facts = hardware_facts(hardware)
+    flags = [bool(hardware.get(f)) for f in HARDWARE_FLAGS]
+
+    eligible = {u: catalog.select(u, filters) for u in usecases}
+    candidates = 0
+    for bits in eligible.values():
+        candidates |= bits
+
+    # (score, id) pairs per scenario; result dicts are only built for the top_k
+    scored = [[[] for _ in skill_levels] for _ in usecases]
+
+    for key in catalog.ids_in(candidates):
+        bit = catalog.by_id[key]
+        grid = score_scenarios(catalog.distros[key], compiled[key], facts, flags)
+
+        for u, usecase in enumerate(usecases):
+            if not eligible[usecase] & bit:
+                continue
+            for s, score in enumerate(grid[u]):
+                scored[u][s].append((score, key))
+
+    result = {}
+    for u, usecase in enumerate(usecases):
+        result[usecase] = {}
+        for s, skill_level in enumerate(skill_levels):
+            rows = scored[u][s]
+            rows.sort(key=itemgetter(0), reverse=True)
+            result[usecase][skill_level] = [
+                {"id": key, "name": catalog.distros[key].get("name", key), "score": score}
+                for score, key in rows[:top_k]
+            ]
+
+    return result
+
+
 # ---------------------------------------------------------
 # EXPLANATION ENGINE (Phase 7 + Phase 8)
 # ---------------------------------------------------------
-def build_explanation(top_3: list, hardware: dict, usecase: str, skill_level: str) -> str:
-    if not top_3:
-        return "No suitable distros were found based on your hardware and preferences."
+# The explanation is assembled from independent sections so bulk report
+# generation (engine/reports.py) can render each distinct section once.
+REASONING_LINES = {
+    "is_laptop": "- Laptop detected: prioritizing distros with strong power management and good laptop support.",
+    "touchscreen": "- Touchscreen detected: recommending distros with excellent touch support (GNOME, KDE, COSMIC).",
+    "hidpi": "- HiDPI display detected: prioritizing distros with strong scaling support (GNOME, KDE, COSMIC).",
+    "optimus": "- NVIDIA Optimus hybrid GPU detected: recommending distros with reliable hybrid graphics support (Pop!_OS, Fedora, Ubuntu).",
+    "amd_apu": "- AMD APU detected: prioritizing distros with strong Mesa support (Fedora, Ubuntu, Mint).",
+    "egpu": "- External GPU detected: recommending distros with strong Thunderbolt/eGPU support (Fedora, Ubuntu)."
+}
 
-    best = top_3[0]
-    distro = best["data"]
-    name = best["name"]
+NO_RESULTS_TEXT = "No suitable distros were found based on your hardware and preferences."
+
+
+def hardware_flag_mask(hardware: dict) -> int:
+    mask = 0
+    for i, flag in enumerate(HARDWARE_FLAGS):
+        if hardware.get(flag):
+            mask |= 1 << i
+    return mask
 
+
+def explain_intro(name: str, usecase: str, skill_level: str) -> str:
     lines = []
     lines.append(f"{name} is the best match for your system based on your hardware, skill level, and selected use-case.\n")
 
     # --- User choices ---
     lines.append(f"Use-case selected: {usecase}")
     lines.append(f"Skill level: {skill_level}\n")
+    return "\n".join(lines)
+
 
-    # --- Hardware summary ---
+def explain_hardware(hardware: dict) -> str:
     gpu = hardware.get("gpu", {}).get("gpu_model", "Unknown GPU")
     ram = hardware.get("ram", {}).get("total_gb", "Unknown")
     storage = hardware.get("storage", {}).get("type", "Unknown")
 
+    lines = []
     lines.append("=== Hardware Detected ===")
     lines.append(f"- GPU: {gpu}")
     lines.append(f"- RAM: {ram} GB")
     lines.append(f"- Storage: {storage}")
+    return "\n".join(lines)
 
-    # --- Phase 7 Hardware Intelligence Explanations ---
-    lines.append("\n=== Hardware-Based Reasoning ===")
-
-    # Laptop
-    if hardware.get("is_laptop"):
-        lines.append("- Laptop detected: prioritizing distros with strong power management and good laptop support.")
 
-    # Touchscreen
-    if hardware.get("touchscreen"):
-        lines.append("- Touchscreen detected: recommending distros with excellent touch support (GNOME, KDE, COSMIC).")
+# Depends only on the six hardware flags (see hardware_flag_mask)
+def explain_reasoning(flag_mask: int) -> str:
+    lines = ["\n=== Hardware-Based Reasoning ==="]
 
-    # HiDPI
-    if hardware.get("hidpi"):
-        lines.append("- HiDPI display detected: prioritizing distros with strong scaling support (GNOME, KDE, COSMIC).")
+    for i, flag in enumerate(HARDWARE_FLAGS):
+        if flag_mask >> i & 1:
+            lines.append(REASONING_LINES[flag])
 
-    # NVIDIA Optimus
-    if hardware.get("optimus"):
-        lines.append("- NVIDIA Optimus hybrid GPU detected: recommending distros with reliable hybrid graphics support (Pop!_OS, Fedora, Ubuntu).")
+    # If no hardware intelligence triggered
+    if not flag_mask:
+        lines.append("- No special hardware conditions detected; using general scoring rules.")
 
-    # AMD APU
-    if hardware.get("amd_apu"):
-        lines.append("- AMD APU detected: prioritizing distros with strong Mesa support (Fedora, Ubuntu, Mint).")
+    return "\n".join(lines)
 
-    # eGPU
-    if hardware.get("egpu"):
-        lines.append("- External GPU detected: recommending distros with strong Thunderbolt/eGPU support (Fedora, Ubuntu).")
 
-    # If no hardware intelligence triggered
-    if not any([
-        hardware.get("is_laptop"),
-        hardware.get("touchscreen"),
-        hardware.get("hidpi"),
-        hardware.get("optimus"),
-        hardware.get("amd_apu"),
-        hardware.get("egpu")
-    ]):
-        lines.append("- No special hardware conditions detected; using general scoring rules.")
+# Depends only on the distro (and the loaded profiles)
+def explain_distro(distro: dict, profiles: dict) -> str:
+    lines = []
 
     # --- Distro details ---
     lines.append("\n=== Distro Characteristics ===")
@@ -136,7 +188,6 @@ def build_explanation(top_3: list, hardware: dict, usecase: str, skill_level: st
     lines.append(f"- Desktop environment: {desktop}")
 
     # --- Phase 8: Distro Profile Integration ---
-    profiles = load_profiles()
     key = distro.get("id", "").lower()
 
     if key in profiles:
@@ -169,6 +220,25 @@ def build_explanation(top_3: list, hardware: dict, usecase: str, skill_level: st
         if "notes" in p:
             lines.append(f"Notes: {p['notes']}")
 
-    lines.append(f"\nOverall, {name} scored highest for your selected use-case and hardware profile.")
-
     return "\n".join(lines)
+
+
+def explain_outro(name: str) -> str:
+    return f"\nOverall, {name} scored highest for your selected use-case and hardware profile."
+
+
+def build_explanation(top_3: list, hardware: dict, usecase: str, skill_level: str) -> str:
+    if not top_3:
+        return NO_RESULTS_TEXT
+
+    best = top_3[0]
+    distro = best["data"]
+    name = best["name"]
+
+    return "\n".join([
+        explain_intro(name, usecase, skill_level),
+        explain_hardware(hardware),
+        explain_reasoning(hardware_flag_mask(hardware)),
+        explain_distro(distro, load_profiles()),
+        explain_outro(name)
+    ])
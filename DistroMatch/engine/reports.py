@@ -0,0 +1,96 @@
+import gzip
+from .catalog import load_catalog
+from .ranking import (
+    NO_RESULTS_TEXT, rank_distros, load_profiles, hardware_flag_mask,
+    explain_intro, explain_hardware, explain_reasoning, explain_distro, explain_outro
+)
+
+RESULTS_HEADER = "=== Top 3 Linux Distro Recommendations ===\n\n"
+
+
+# ---------------------------------------------------------
+# Bulk Fleet Reports
+# ---------------------------------------------------------
+# Writes one report per machine (ranking lines + the same explanation
+# build_explanation produces) to a gzip stream.
+#
+# Everything except the hardware summary and the ranking lines is shared
+# by machines with the same (top distro, flag bitmask, usecase, skill), so
+# those sections are rendered and encoded once per group and reused as bytes.
+#
+# machines: iterable of dicts with "id", "hardware", "usecase", "skill_level"
+# and optionally "top_3" ([{"id", "name", "score"}, ...] as returned by
+# get_recommendations / run_fleet); machines without it are ranked here.
+def render_fleet_reports(machines, output_path: str, compresslevel: int = 6) -> dict:
+    catalog = load_catalog()
+    profiles = load_profiles()
+
+    intros = {}
+    reasonings = {}
+    distros = {}
+    groups = {}
+
+    count = 0
+    written = 0
+
+    with gzip.open(output_path, "wb", compresslevel=compresslevel) as out:
+        for machine in machines:
+            hardware = machine["hardware"]
+            usecase = machine["usecase"]
+            skill_level = machine["skill_level"]
+
+            top_3 = machine.get("top_3")
+            if top_3 is None:
+                top_3 = rank_distros(hardware, usecase, skill_level)[:3]
+
+            chunks = [f"##### Machine {machine['id']} #####\n{RESULTS_HEADER}".encode("utf-8")]
+            chunks.append("".join(
+                f"{i}. {item['name']} — Score: {item['score']}\n"
+                for i, item in enumerate(top_3, start=1)
+            ).encode("utf-8"))
+            chunks.append(b"\n")
+
+            if not top_3:
+                chunks.append(NO_RESULTS_TEXT.encode("utf-8"))
+            else:
+                best = top_3[0]
+                mask = hardware_flag_mask(hardware)
+                group_key = (best["id"], mask, usecase, skill_level)
+
+                if group_key not in groups:
+                    name = best["name"]
+                    intro_key = (name, usecase, skill_level)
+                    if intro_key not in intros:
+                        intros[intro_key] = explain_intro(name, usecase, skill_level)
+                    if mask not in reasonings:
+                        reasonings[mask] = explain_reasoning(mask)
+                    if best["id"] not in distros:
+                        distros[best["id"]] = explain_distro(catalog.distros[best["id"]], profiles)
+
+                    groups[group_key] = (
+                        (intros[intro_key] + "\n").encode("utf-8"),
+                        "\n".join([
+                            "",
+                            reasonings[mask],
+                            distros[best["id"]],
+                            explain_outro(name)
+                        ]).encode("utf-8")
+                    )
+
+                head, tail = groups[group_key]
+                chunks.append(head)
+                chunks.append(explain_hardware(hardware).encode("utf-8"))
+                chunks.append(tail)
+
+            chunks.append(b"\n\n")
+            report = b"".join(chunks)
+            out.write(report)
+
+            count += 1
+            written += len(report)
+
+    return {
+        "machines": count,
+        "groups": len(groups),
+        "bytes": written
+    }
@@ -4,6 +4,21 @@ from pathlib import Path
 DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "distros.json"
 
 
+# Bump whenever a scoring rule or weight changes; persisted results
+# computed under an older version are then recomputed.
+SCORING_RULES_VERSION = 2
+
+USECASES = ["gaming", "work", "browsing"]
+SKILL_LEVELS = ["beginner", "casual", "intermediate", "advanced"]
+HARDWARE_FLAGS = ["is_laptop", "touchscreen", "hidpi", "optimus", "amd_apu", "egpu"]
+
+# Every distinct case hardware_score distinguishes, for code that tabulates
+# or bounds it: GPU vendor x RAM band x storage class (x weight group).
+GPU_VENDORS = ["nvidia", "amd", "intel", "unknown"]
+STORAGE_CLASSES = ["hdd", "ssd", "unknown"]
+RAM_BANDS = 3
+
+
 def load_distros():
     with open(DATA_PATH, "r", encoding="utf-8") as f:
         return json.load(f)
@@ -37,14 +52,44 @@ def get_storage_type(hardware: dict) -> str:
     return hardware.get("storage", {}).get("type", "unknown").lower()
 
 
+# Parsed once per machine and shared across every distro/scenario
+def hardware_facts(hardware: dict) -> tuple:
+    gpu_model = hardware.get("gpu", {}).get("gpu_model", "Unknown GPU")
+    return detect_gpu_vendor(gpu_model), get_ram_gb(hardware), get_storage_type(hardware)
+
+
+# ---------------------------------------------------------
+# Hardware Cases
+# ---------------------------------------------------------
+def storage_class(storage: str) -> str:
+    if "hdd" in storage:
+        return "hdd"
+    if "ssd" in storage or "nvme" in storage:
+        return "ssd"
+    return "unknown"
+
+
+# 0: below ram_min, 1: below ram_optimal, 2: at or above ram_optimal
+def ram_band(distro: dict, ram_gb: float) -> int:
+    if ram_gb < distro.get("ram_min", 2):
+        return 0
+    if ram_gb < distro.get("ram_optimal", 4):
+        return 1
+    return 2
+
+
+# One RAM amount inside each band (band 1 may be empty; its sample then
+# falls in band 2, which is harmless since no machine can land in band 1)
+def ram_band_samples(distro: dict) -> list:
+    ram_min = distro.get("ram_min", 2)
+    return [ram_min - 1, ram_min, max(ram_min, distro.get("ram_optimal", 4))]
+
+
 # ---------------------------------------------------------
 # Hardware Score (Base)
 # ---------------------------------------------------------
-def hardware_score(distro: dict, hardware: dict, usecase: str) -> float:
-    gpu_model = hardware.get("gpu", {}).get("gpu_model", "Unknown GPU")
-    vendor = detect_gpu_vendor(gpu_model)
-    ram_gb = get_ram_gb(hardware)
-    storage = get_storage_type(hardware)
+def hardware_score(distro: dict, hardware: dict, usecase: str, facts: tuple = None) -> float:
+    vendor, ram_gb, storage = facts or hardware_facts(hardware)
 
     gpu_support = distro.get("gpu_support", {})
     gpu_score = gpu_support.get(vendor, 5)
@@ -54,24 +99,17 @@ def hardware_score(distro: dict, hardware: dict, usecase: str) -> float:
         gpu_score *= 0.1
 
     # RAM scoring
-    ram_min = distro.get("ram_min", 2)
-    ram_opt = distro.get("ram_optimal", 4)
-
-    if ram_gb < ram_min:
-        ram_score = 2
-    elif ram_min <= ram_gb < ram_opt:
-        ram_score = 7
-    else:
-        ram_score = 10
+    ram_score = [2, 7, 10][ram_band(distro, ram_gb)]
 
     # Storage scoring
     storage_bonus = 0
-    if "hdd" in storage:
+    storage = storage_class(storage)
+    if storage == "hdd":
         if distro.get("desktop", "").lower() in ["gnome", "cosmic"]:
             storage_bonus -= 2
         else:
             storage_bonus += 1
-    elif "ssd" in storage or "nvme" in storage:
+    elif storage == "ssd":
         storage_bonus += 1
 
     score = (gpu_score * 0.2) + (ram_score * 0.8) + storage_bonus
@@ -174,12 +212,13 @@ def usecase_score(distro: dict, usecase: str) -> float:
 # ---------------------------------------------------------
 def skill_score(distro: dict, skill_level: str, usecase: str) -> float:
     skill_level = skill_level.lower()
+    usecase = usecase.lower()
     skill_map = distro.get("skill", {})
     base = skill_map.get(skill_level, 0)
     categories = [c.lower() for c in distro.get("category", [])]
 
     # Work/Browsing: boost work distros
-    if usecase.lower() in ["work", "browsing"]:
+    if usecase in ["work", "browsing"]:
         if "work" in categories:
             base += 15
         if "lightweight" in categories and usecase == "browsing":
@@ -203,27 +242,48 @@ def performance_score(distro: dict, usecase: str) -> float:
     return float(distro.get("performance", 7))
 
 
+# ---------------------------------------------------------
+# Weights
+# ---------------------------------------------------------
+WEIGHT_KEYS = ["hardware", "usecase", "skill", "stab", "perf"]
+
+WORK_WEIGHTS = {
+    "hardware": 0.10,
+    "usecase":  0.45,
+    "skill":    0.40,
+    "stab":     0.05,
+    "perf":     0.00
+}
+
+DEFAULT_WEIGHTS = {
+    "hardware": 0.35,
+    "usecase":  0.30,
+    "skill":    0.20,
+    "stab":     0.10,
+    "perf":     0.05
+}
+
+
+def get_weights(usecase: str) -> dict:
+    if usecase.lower() in ["work", "browsing"]:
+        return WORK_WEIGHTS
+    return DEFAULT_WEIGHTS
+
+
+# hardware_score only depends on the usecase through its weight group
+def weight_group(usecase: str) -> str:
+    return "work" if get_weights(usecase) is WORK_WEIGHTS else "default"
+
+
+WEIGHT_GROUP_USECASES = {"work": "work", "default": "gaming"}
+
+
 # ---------------------------------------------------------
 # FINAL SCORE
 # ---------------------------------------------------------
 def compute_final_score(distro: dict, hardware: dict, usecase: str, skill_level: str) -> float:
 
-    if usecase.lower() in ["work", "browsing"]:
-        weights = {
-            "hardware": 0.10,
-            "usecase":  0.45,
-            "skill":    0.40,
-            "stab":     0.05,
-            "perf":     0.00
-        }
-    else:
-        weights = {
-            "hardware": 0.35,
-            "usecase":  0.30,
-            "skill":    0.20,
-            "stab":     0.10,
-            "perf":     0.05
-        }
+    weights = get_weights(usecase)
 
     h = hardware_score(distro, hardware, usecase)
     h2 = hardware_intelligence_bonus(distro, hardware)
@@ -241,3 +301,68 @@ def compute_final_score(distro: dict, hardware: dict, usecase: str, skill_level:
     )
 
     return round(final, 2)
+
+
+# ---------------------------------------------------------
+# MULTI-SCENARIO SCORE GRID
+# ---------------------------------------------------------
+# Every score is the component row [h + h2, u, s, stab, perf] dotted with
+# the usecase's weight row. Only h (hardware_score) and h2 (the flag bonus)
+# depend on the machine, so everything else is compiled once per distro:
+#   - hardware_score for each weight group / vendor / RAM band / storage class
+#   - the flag bonus per flag (hardware_intelligence_bonus sums independent
+#     per-flag terms)
+#   - the weighted u/s/stab/perf terms for each scenario
+# Per machine, scoring is then table lookups plus the weighted sum, added in
+# the same order as compute_final_score so results match it exactly.
+def compile_scenarios(distro: dict, usecases: list, skill_levels: list) -> dict:
+    hw = {}
+    samples = ram_band_samples(distro)
+    for group, usecase in WEIGHT_GROUP_USECASES.items():
+        for vendor in GPU_VENDORS:
+            for band in range(RAM_BANDS):
+                for storage in STORAGE_CLASSES:
+                    facts = (vendor, samples[band], storage)
+                    hw[(group, vendor, band, storage)] = hardware_score(distro, {}, usecase, facts)
+
+    stab = stability_score(distro)
+    rows = []
+    for usecase in usecases:
+        weights = get_weights(usecase)
+        rows.append((
+            usecase,
+            weight_group(usecase),
+            weights["hardware"],
+            usecase_score(distro, usecase) * weights["usecase"],
+            stab * weights["stab"],
+            performance_score(distro, usecase) * weights["perf"],
+            [(skill_level, skill_score(distro, skill_level, usecase) * weights["skill"])
+             for skill_level in skill_levels]
+        ))
+
+    return {
+        "hw": hw,
+        "bonus": [hardware_intelligence_bonus(distro, {flag: True}) for flag in HARDWARE_FLAGS],
+        "rows": rows
+    }
+
+
+# Returns one list of scores per usecase, in compile_scenarios' usecase and
+# skill order
+def score_scenarios(distro: dict, compiled: dict, facts: tuple, flags: list) -> list:
+    vendor, ram_gb, storage = facts
+    band = ram_band(distro, ram_gb)
+    storage = storage_class(storage)
+
+    h2 = 0
+    for i, on in enumerate(flags):
+        if on:
+            h2 += compiled["bonus"][i]
+
+    hw = compiled["hw"]
+    grid = []
+    for usecase, group, w_hw, u_term, stab_term, perf_term, skills in compiled["rows"]:
+        prefix = (hw[(group, vendor, band, storage)] + h2) * w_hw + u_term
+        grid.append([round(prefix + s_term + stab_term + perf_term, 2) for _, s_term in skills])
+
+    return grid
@@ -0,0 +1,305 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+from .catalog import load_catalog
+from .scoring import (
+    USECASES, SKILL_LEVELS, HARDWARE_FLAGS, GPU_VENDORS, STORAGE_CLASSES, RAM_BANDS,
+    WEIGHT_GROUP_USECASES, get_weights, weight_group, hardware_facts, storage_class
+)
+
+# Shared catalog layout (memory-mapped files, on tmpfs where available)
+# ---------------------
+# Control file "<name>":         generation (uint64)
+# Segment file "<name>.g<gen>":  header | float64 table [rows x cols] | JSON [[id, name], ...]
+#
+# The table is a flat copy of scoring.compile_scenarios for every distro
+# (hardware cases, per-flag bonus, weighted usecase/skill/stab/perf terms),
+# so workers only do lookups and the final weighted sum. Publishing a new catalog writes a new data segment and then
+# bumps the generation; workers notice on refresh() and remap.
+DEFAULT_NAME = "distromatch_catalog"
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+CONTROL = struct.Struct("<Q")
+HEADER = struct.Struct("<QQQQ")  # generation, rows, cols, names_len
+
+
+def _build_columns() -> dict:
+    columns = {}
+
+    def add(key):
+        columns[key] = len(columns)
+
+    add("ram_min")
+    add("ram_optimal")
+
+    # hardware_score per weight group / GPU vendor / RAM band / storage class
+    for group in WEIGHT_GROUP_USECASES:
+        for vendor in GPU_VENDORS:
+            for band in range(RAM_BANDS):
+                for storage in STORAGE_CLASSES:
+                    add(("hw", group, vendor, band, storage))
+
+    # hardware_intelligence_bonus is a sum of independent per-flag terms
+    for flag in HARDWARE_FLAGS:
+        add(("bonus", flag))
+
+    # Weighted terms, as in compile_scenarios' rows
+    for usecase in USECASES:
+        add(("eligible", usecase))
+        add(("usecase", usecase))
+        add(("stab", usecase))
+        add(("perf", usecase))
+        for skill_level in SKILL_LEVELS:
+            add(("skill", usecase, skill_level))
+
+    return columns
+
+
+COLUMNS = _build_columns()
+
+
+# ---------------------------------------------------------
+# Compile
+# ---------------------------------------------------------
+def compile_catalog(catalog) -> tuple:
+    names = []
+    table = array("d", bytes(8 * len(COLUMNS) * len(catalog.ids)))
+    eligible = {u: catalog.eligible(u) for u in USECASES}
+    scenarios = catalog.scenarios(USECASES, SKILL_LEVELS)
+
+    for i, key in enumerate(catalog.ids):
+        distro = catalog.distros[key]
+        compiled = scenarios[key]
+        names.append([key, distro.get("name", key)])
+        base = i * len(COLUMNS)
+
+        def put(col, value):
+            table[base + COLUMNS[col]] = float(value)
+
+        put("ram_min", distro.get("ram_min", 2))
+        put("ram_optimal", distro.get("ram_optimal", 4))
+
+        for case, score in compiled["hw"].items():
+            put(("hw",) + case, score)
+
+        for flag, bonus in zip(HARDWARE_FLAGS, compiled["bonus"]):
+            put(("bonus", flag), bonus)
+
+        for usecase, _, _, u_term, stab_term, perf_term, skills in compiled["rows"]:
+            put(("eligible", usecase), 1 if eligible[usecase] >> i & 1 else 0)
+            put(("usecase", usecase), u_term)
+            put(("stab", usecase), stab_term)
+            put(("perf", usecase), perf_term)
+            for skill_level, s_term in skills:
+                put(("skill", usecase, skill_level), s_term)
+
+    return names, table
+
+
+# ---------------------------------------------------------
+# Mapping helpers
+# ---------------------------------------------------------
+def _map(path: Path, writable: bool = False) -> mmap.mmap:
+    with open(path, "r+b" if writable else "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+
+def _segment_path(control_path: Path, generation: int) -> Path:
+    return control_path.with_name(f"{control_path.name}.g{generation}")
+
+
+# ---------------------------------------------------------
+# Publisher (one per host)
+# ---------------------------------------------------------
+class CatalogPublisher:
+    def __init__(self, name: str = DEFAULT_NAME, directory: str = None):
+        self.path = Path(directory or SHARED_DIR) / name
+
+        # Continue an existing generation sequence so running workers never
+        # see the counter go backwards
+        if not self.path.exists():
+            # Atomically, so a waiting worker never maps a half-written file
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_bytes(CONTROL.pack(0))
+            os.replace(tmp, self.path)
+        self.control = _map(self.path, writable=True)
+        self.generation = CONTROL.unpack_from(self.control, 0)[0]
+
+    def publish(self, catalog=None) -> int:
+        catalog = catalog or load_catalog()
+        names, table = compile_catalog(catalog)
+        blob = json.dumps(names).encode("utf-8")
+
+        generation = self.generation + 1
+        segment = _segment_path(self.path, generation)
+        tmp = segment.with_name(segment.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(generation, len(names), len(COLUMNS), len(blob)))
+            f.write(table.tobytes())
+            f.write(blob)
+        os.replace(tmp, segment)
+
+        # Flip the generation only once the new segment is complete
+        CONTROL.pack_into(self.control, 0, generation)
+
+        # Workers still mapping the old segment keep it alive until they reattach
+        old = _segment_path(self.path, self.generation)
+        self.generation = generation
+        if old.exists():
+            old.unlink()
+
+        return generation
+
+    def close(self, unlink: bool = True):
+        self.control.close()
+        if unlink:
+            _segment_path(self.path, self.generation).unlink(missing_ok=True)
+            self.path.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------
+# Worker view (zero-copy)
+# ---------------------------------------------------------
+# Workers may start before any publisher: until a control file exists (and
+# a generation has been published) refresh() just returns False and rank()
+# raises. A control file replaced by a new publisher is picked up too.
+class SharedCatalog:
+    def __init__(self, name: str = DEFAULT_NAME, directory: str = None):
+        self.path = Path(directory or SHARED_DIR) / name
+        self.control = None
+        self.control_inode = None
+        self.generation = 0
+        self.segment = None
+        self.table = None
+        self.names = []
+        self.refresh()
+
+    def _attach_control(self) -> bool:
+        try:
+            inode = self.path.stat().st_ino
+        except FileNotFoundError:
+            # Publisher gone (or not started yet); keep serving what we have
+            return self.control is not None
+
+        if inode != self.control_inode:
+            if self.control is not None:
+                self.control.close()
+            self.control = _map(self.path)
+            self.control_inode = inode
+            # A new publisher restarts the generation count
+            self.generation = 0
+        return True
+
+    def refresh(self) -> bool:
+        if not self._attach_control():
+            return False
+
+        missing = None
+        while True:
+            generation = CONTROL.unpack_from(self.control, 0)[0]
+            if generation in (0, self.generation):
+                return False
+            try:
+                segment = _map(_segment_path(self.path, generation))
+                break
+            except FileNotFoundError:
+                # Superseded while we were attaching: read the generation again.
+                # The same generation missing twice means the publisher closed.
+                if generation == missing:
+                    return False
+                missing = generation
+
+        _, rows, cols, names_len = HEADER.unpack_from(segment, 0)
+        if cols != len(COLUMNS):
+            segment.close()
+            raise RuntimeError(f"Shared catalog layout mismatch: {cols} columns, expected {len(COLUMNS)}")
+
+        table_end = HEADER.size + rows * cols * 8
+        table = memoryview(segment)[HEADER.size:table_end].cast("d")
+        names = json.loads(segment[table_end:table_end + names_len])
+
+        self._release()
+        self.segment, self.table, self.names = segment, table, names
+        self.generation = generation
+        return True
+
+    def _release(self):
+        if self.table is not None:
+            self.table.release()
+            self.table = None
+        if self.segment is not None:
+            self.segment.close()
+            self.segment = None
+
+    def close(self):
+        self._release()
+        if self.control is not None:
+            self.control.close()
+            self.control = None
+
+    # Same ranking as engine.ranking.rank_distros (usecase and skill level are
+    # matched case-insensitively against USECASES / SKILL_LEVELS)
+    def rank(self, hardware: dict, usecase: str, skill_level: str, top_k: int = 3) -> list:
+        usecase = usecase.lower()
+        skill_level = skill_level.lower()
+        if usecase not in USECASES or skill_level not in SKILL_LEVELS:
+            raise ValueError(f"Unsupported scenario: {usecase}/{skill_level}")
+        if self.table is None:
+            # Attached before any publish(); an empty ranking would look like no matches
+            self.refresh()
+            if self.table is None:
+                raise RuntimeError(f"No catalog has been published to {self.path} yet")
+
+        vendor, ram_gb, storage = hardware_facts(hardware)
+        w_hw = get_weights(usecase)["hardware"]
+        group = weight_group(usecase)
+        storage = storage_class(storage)
+
+        hw_cols = [COLUMNS[("hw", group, vendor, band, storage)] for band in range(RAM_BANDS)]
+        bonus_cols = [COLUMNS[("bonus", f)] for f in HARDWARE_FLAGS if hardware.get(f)]
+        c_ram_min = COLUMNS["ram_min"]
+        c_ram_opt = COLUMNS["ram_optimal"]
+        c_stab = COLUMNS[("stab", usecase)]
+        c_eligible = COLUMNS[("eligible", usecase)]
+        c_use = COLUMNS[("usecase", usecase)]
+        c_perf = COLUMNS[("perf", usecase)]
+        c_skill = COLUMNS[("skill", usecase, skill_level)]
+
+        table = self.table
+        cols = len(COLUMNS)
+        scored = []
+
+        for i, (key, name) in enumerate(self.names):
+            base = i * cols
+            if not table[base + c_eligible]:
+                continue
+
+            if ram_gb < table[base + c_ram_min]:
+                band = 0
+            elif ram_gb < table[base + c_ram_opt]:
+                band = 1
+            else:
+                band = 2
+
+            h = table[base + hw_cols[band]]
+            h2 = 0
+            for c in bonus_cols:
+                h2 += table[base + c]
+
+            # Same summation order as score_scenarios / compute_final_score
+            final = (
+                (h + h2) * w_hw +
+                table[base + c_use] +
+                table[base + c_skill] +
+                table[base + c_stab] +
+                table[base + c_perf]
+            )
+
+            scored.append({"id": key, "name": name, "score": round(final, 2)})
+
+        scored.sort(key=lambda x: x["score"], reverse=True)
+        return scored[:top_k]
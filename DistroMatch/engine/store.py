@@ -0,0 +1,165 @@
+import hashlib
+import json
+import sqlite3
+from .catalog import load_catalog
+from .ranking import get_recommendations, load_profiles
+from .scoring import SCORING_RULES_VERSION, HARDWARE_FLAGS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS machines (
+    machine_id  TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    hardware    TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint     TEXT NOT NULL,
+    usecase         TEXT NOT NULL,
+    skill_level     TEXT NOT NULL,
+    filters         TEXT NOT NULL,
+    catalog_version TEXT NOT NULL,
+    rules_version   INTEGER NOT NULL,
+    result          TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, usecase, skill_level, filters, catalog_version, rules_version)
+);
+"""
+
+
+# ---------------------------------------------------------
+# Fingerprints + Versions
+# ---------------------------------------------------------
+# Only the fields scoring and explanations read are fingerprinted, so
+# unrelated scan noise (CPU flags, OS version...) never forces a rescore.
+def hardware_fingerprint(hardware: dict) -> str:
+    relevant = {
+        "gpu": hardware.get("gpu", {}).get("gpu_model", "Unknown GPU"),
+        "ram": hardware.get("ram", {}).get("total_gb", "Unknown"),
+        "storage": hardware.get("storage", {}).get("type", "Unknown"),
+        "flags": [bool(hardware.get(f)) for f in HARDWARE_FLAGS]
+    }
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# Catalog + profiles: both feed the stored result (scores + explanation)
+def inputs_version(catalog=None) -> str:
+    catalog = catalog or load_catalog()
+    profiles = json.dumps(load_profiles(), sort_keys=True).encode("utf-8")
+    return f"{catalog.version}:{hashlib.sha256(profiles).hexdigest()[:16]}"
+
+
+# ---------------------------------------------------------
+# Result Store (SQLite)
+# ---------------------------------------------------------
+class ResultStore:
+    def __init__(self, path: str = "distromatch_results.db"):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, fingerprint: str, usecase: str, skill_level: str, filters: str, version: str):
+        row = self.conn.execute(
+            "SELECT result FROM results WHERE fingerprint = ? AND usecase = ? AND skill_level = ?"
+            " AND filters = ? AND catalog_version = ? AND rules_version = ?",
+            (fingerprint, usecase, skill_level, filters, version, SCORING_RULES_VERSION)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, fingerprint: str, usecase: str, skill_level: str, filters: str, version: str, result: dict):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (fingerprint, usecase, skill_level, filters, version, SCORING_RULES_VERSION, json.dumps(result))
+        )
+
+    def set_machine(self, machine_id: str, fingerprint: str, hardware: dict):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO machines VALUES (?, ?, ?)",
+            (machine_id, fingerprint, json.dumps(hardware))
+        )
+
+    # {machine_id: {"hardware", "top_3"}}; top_3 is None when no result is
+    # stored for that scenario/version
+    def inventory(self, usecase: str, skill_level: str, filters: str, version: str) -> dict:
+        rows = self.conn.execute(
+            "SELECT m.machine_id, m.hardware, r.result FROM machines m"
+            " LEFT JOIN results r ON r.fingerprint = m.fingerprint AND r.usecase = ?"
+            " AND r.skill_level = ? AND r.filters = ? AND r.catalog_version = ? AND r.rules_version = ?"
+            " ORDER BY m.machine_id",
+            (usecase, skill_level, filters, version, SCORING_RULES_VERSION)
+        )
+        return {
+            machine_id: {
+                "hardware": json.loads(hardware),
+                "top_3": json.loads(result)["top_3"] if result else None
+            }
+            for machine_id, hardware, result in rows
+        }
+
+    def machines(self) -> dict:
+        rows = self.conn.execute("SELECT machine_id, hardware FROM machines ORDER BY machine_id")
+        return {machine_id: json.loads(hardware) for machine_id, hardware in rows}
+
+    # Drop machines that are no longer part of the fleet
+    def prune_machines(self, active_ids) -> int:
+        active = set(active_ids)
+        stale = [
+            (machine_id,) for (machine_id,) in self.conn.execute("SELECT machine_id FROM machines")
+            if machine_id not in active
+        ]
+        self.conn.executemany("DELETE FROM machines WHERE machine_id = ?", stale)
+        return len(stale)
+
+    # Drop results no longer reachable under the current catalog/rules
+    def prune(self, version: str = None) -> int:
+        version = version or inputs_version()
+        cur = self.conn.execute(
+            "DELETE FROM results WHERE catalog_version != ? OR rules_version != ?",
+            (version, SCORING_RULES_VERSION)
+        )
+        self.conn.commit()
+        return cur.rowcount
+
+
+# ---------------------------------------------------------
+# Incremental Fleet Run
+# ---------------------------------------------------------
+# machines: {machine_id: hardware}. Machines whose fingerprint already has
+# a result for the current catalog/rules/scenario are served from the store;
+# everything else is rescored and written back. With retire_missing (the
+# default, for whole-fleet runs) machines absent from `machines` are removed
+# from the store; pass False when running a subset of the fleet.
+def run_fleet(machines: dict, usecase: str, skill_level: str, store: ResultStore,
+              filters: dict = None, retire_missing: bool = True) -> dict:
+    version = inputs_version()
+    filters_key = json.dumps(filters or {}, sort_keys=True)
+
+    results = {}
+    reused = 0
+    recomputed = 0
+    retired = 0
+
+    with store.conn:
+        if retire_missing:
+            retired = store.prune_machines(machines)
+
+        for machine_id, hardware in machines.items():
+            fingerprint = hardware_fingerprint(hardware)
+            store.set_machine(machine_id, fingerprint, hardware)
+
+            result = store.get(fingerprint, usecase, skill_level, filters_key, version)
+            if result is None:
+                result = get_recommendations(hardware, usecase, skill_level, filters)
+                store.put(fingerprint, usecase, skill_level, filters_key, version, result)
+                recomputed += 1
+            else:
+                reused += 1
+
+            results[machine_id] = result
+
+    return {
+        "results": results,
+        "reused": reused,
+        "recomputed": recomputed,
+        "retired": retired
+    }
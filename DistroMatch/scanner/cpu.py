@@ -1,12 +1,13 @@
 import platform
 import cpuinfo
+from . import probes
 
 def scan_cpu():
-    info = cpuinfo.get_cpu_info()
+    info = probes.call("cpuinfo.get_cpu_info", cpuinfo.get_cpu_info)
 
     return {
         "cpu_model": info.get("brand_raw", "Unknown CPU"),
-        "architecture": platform.machine(),
+        "architecture": probes.call("platform.machine", platform.machine),
         "cores": info.get("count", 0),
         "flags": info.get("flags", []),
     }
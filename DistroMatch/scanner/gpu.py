@@ -1,15 +1,14 @@
 import platform
-import subprocess
+from . import probes
 
 def scan_gpu():
-    system = platform.system()
+    system = probes.call("platform.system", platform.system)
 
     # === Windows ===
     if system == "Windows":
         try:
-            output = subprocess.check_output(
-                "wmic path win32_videocontroller get name",
-                shell=True
+            output = probes.run(
+                "wmic path win32_videocontroller get name"
             ).decode(errors="ignore").split("\n")
 
             gpus = [line.strip() for line in output if line.strip() and "Name" not in line]
@@ -24,9 +23,8 @@ def scan_gpu():
     # === Linux ===
     if system == "Linux":
         try:
-            output = subprocess.check_output(
-                "lspci | grep -E 'VGA|3D'",
-                shell=True
+            output = probes.run(
+                "lspci | grep -E 'VGA|3D'"
             ).decode(errors="ignore")
 
             return {
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import time
+
+# Every environment-dependent read the detectors make goes through this
+# module, so a scan can be captured on a real machine and replayed
+# anywhere (see scanner/replay.py). With no session active, probes simply
+# run live.
+_session = None
+
+
+# A probe that failed on the captured machine, raised again on replay
+class ReplayedProbeError(Exception):
+    pass
+
+
+# A probe the replayed bundle has no recording for
+class MissingProbeError(LookupError):
+    pass
+
+
+# ---------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------
+class CaptureSession:
+    def __init__(self):
+        self.probes = {}
+
+    def probe(self, key: str, fn):
+        start = time.perf_counter()
+        try:
+            value = fn()
+        except Exception as e:
+            self.probes[key] = {
+                "error": {"type": type(e).__name__, "message": str(e)},
+                "seconds": time.perf_counter() - start
+            }
+            raise
+        self.probes[key] = {"value": value, "seconds": time.perf_counter() - start}
+        return value
+
+
+class ReplaySession:
+    # latency: None (no delay), seconds per probe, {kind: seconds} keyed by
+    # the prefix before ":" (e.g. "cmd", "read"), or "recorded" to reuse
+    # the durations captured on the original machine
+    def __init__(self, probes: dict, latency=None):
+        self.probes = probes
+        self.latency = latency
+
+    def _delay(self, key: str, entry: dict) -> float:
+        if self.latency is None:
+            return 0
+        if self.latency == "recorded":
+            return entry.get("seconds", 0)
+        if isinstance(self.latency, dict):
+            return self.latency.get(key.split(":", 1)[0], 0)
+        return float(self.latency)
+
+    def probe(self, key: str, fn):
+        if key not in self.probes:
+            raise MissingProbeError(key)
+        entry = self.probes[key]
+
+        delay = self._delay(key, entry)
+        if delay:
+            time.sleep(delay)
+
+        if "error" in entry:
+            raise ReplayedProbeError(f"{entry['error']['type']}: {entry['error']['message']}")
+        return entry["value"]
+
+
+def set_session(session):
+    global _session
+    previous, _session = _session, session
+    return previous
+
+
+def _probe(key: str, fn):
+    if _session is None:
+        return fn()
+    return _session.probe(key, fn)
+
+
+# ---------------------------------------------------------
+# Probe Functions
+# ---------------------------------------------------------
+# Command output is kept as latin-1 text so it round-trips byte-exact through JSON
+def run(cmd: str) -> bytes:
+    value = _probe(
+        f"cmd:{cmd}",
+        lambda: subprocess.check_output(cmd, shell=True).decode("latin-1")
+    )
+    return value.encode("latin-1")
+
+
+def read_text(path: str) -> str:
+    def read():
+        with open(path) as f:
+            return f.read()
+    return _probe(f"read:{path}", read)
+
+
+def path_exists(path: str) -> bool:
+    return _probe(f"exists:{path}", lambda: os.path.exists(path))
+
+
+# Library calls (psutil, cpuinfo, platform); results must be JSON-serializable
+def call(name: str, fn):
+    return _probe(f"call:{name}", fn)
@@ -1,8 +1,9 @@
 import psutil
+from . import probes
 
 def scan_ram():
-    mem = psutil.virtual_memory()
+    total = probes.call("psutil.virtual_memory.total", lambda: psutil.virtual_memory().total)
 
     return {
-        "total_gb": round(mem.total / (1024**3), 2)
+        "total_gb": round(total / (1024**3), 2)
     }
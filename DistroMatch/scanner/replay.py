@@ -0,0 +1,124 @@
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime, timezone
+from . import probes
+from . import full_scan as system_scan
+from .scanner import full_scan as hardware_scan
+
+BUNDLE_FORMAT = 1
+
+
+# Both scan paths, so a bundle covers every probe the app can make
+def default_scan() -> dict:
+    return {
+        "hardware": hardware_scan(),
+        "system": system_scan()
+    }
+
+
+# ---------------------------------------------------------
+# Capture
+# ---------------------------------------------------------
+# Runs the scan live, recording every probe output (and failure) plus the
+# scan result itself into one gzipped JSON bundle.
+def capture_bundle(path: str, scan=None) -> dict:
+    scan = scan or default_scan
+    session = probes.CaptureSession()
+
+    previous = probes.set_session(session)
+    try:
+        result = scan()
+    finally:
+        probes.set_session(previous)
+
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "captured": datetime.now(timezone.utc).isoformat(),
+        "probes": session.probes,
+        "scan": result
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(bundle, f)
+    return bundle
+
+
+def load_bundle(path: str) -> dict:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        bundle = json.load(f)
+    if bundle.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported bundle format in {path}: {bundle.get('format')}")
+    return bundle
+
+
+# ---------------------------------------------------------
+# Replay
+# ---------------------------------------------------------
+# latency: see probes.ReplaySession
+def replay_bundle(bundle: dict, latency=None, scan=None) -> dict:
+    scan = scan or default_scan
+    previous = probes.set_session(probes.ReplaySession(bundle["probes"], latency))
+    try:
+        return scan()
+    finally:
+        probes.set_session(previous)
+
+
+# ---------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------
+# Replays every bundle `repeat` times. Bundles are loaded up front so only
+# the scan path is timed; a replayed scan that differs from the recorded
+# one is reported as a mismatch (JSON round-trip applied for comparison).
+def benchmark(paths: list, latency=None, repeat: int = 1, scan=None) -> dict:
+    bundles = [(path, load_bundle(path)) for path in paths]
+    mismatches = []
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path, bundle in bundles:
+            result = replay_bundle(bundle, latency, scan)
+            if json.loads(json.dumps(result)) != bundle["scan"] and path not in mismatches:
+                mismatches.append(path)
+    seconds = time.perf_counter() - start
+
+    scans = len(bundles) * repeat
+    return {
+        "machines": len(bundles),
+        "scans": scans,
+        "seconds": round(seconds, 4),
+        "ms_per_scan": round(seconds * 1000 / scans, 3) if scans else 0,
+        "mismatches": mismatches
+    }
+
+
+def _parse_latency(value: str):
+    if value is None or value == "recorded":
+        return value
+    return float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture or replay DistroMatch scanner probes.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    cap = sub.add_parser("capture", help="record this machine's probes into a bundle")
+    cap.add_argument("output")
+
+    bench = sub.add_parser("bench", help="replay bundles and time the scan path")
+    bench.add_argument("bundles", nargs="+")
+    bench.add_argument("--latency", help="seconds per probe, or 'recorded'")
+    bench.add_argument("--repeat", type=int, default=1)
+
+    args = parser.parse_args()
+
+    if args.command == "capture":
+        bundle = capture_bundle(args.output)
+        print(f"Captured {len(bundle['probes'])} probes to {args.output}")
+    else:
+        print(json.dumps(benchmark(args.bundles, _parse_latency(args.latency), args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
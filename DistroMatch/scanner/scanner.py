@@ -1,21 +1,22 @@
 import psutil
-import subprocess
-import platform
-import os
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from . import probes
+from .gpu import scan_gpu
+from .ram import scan_ram
+from .storage import scan_storage
 
 
 def detect_laptop():
     # Battery present = laptop
     try:
-        battery = psutil.sensors_battery()
-        return battery is not None
+        return probes.call("psutil.sensors_battery.present", lambda: psutil.sensors_battery() is not None)
     except:
         return False
 
 
 def detect_touchscreen():
     try:
-        output = subprocess.check_output("xinput --list", shell=True).decode().lower()
+        output = probes.run("xinput --list").decode().lower()
         return "touchscreen" in output or "touch screen" in output
     except:
         return False
@@ -23,7 +24,7 @@ def detect_touchscreen():
 
 def detect_hidpi():
     try:
-        output = subprocess.check_output("xdpyinfo | grep dots", shell=True).decode()
+        output = probes.run("xdpyinfo | grep dots").decode()
         # Example: resolution:    3840x2160 dots (163x163 dots per inch)
         if "dots per inch" in output:
             dpi = int(output.split("per inch")[0].split()[-1])
@@ -35,7 +36,7 @@ def detect_hidpi():
 
 def detect_nvidia_optimus():
     try:
-        output = subprocess.check_output("lspci", shell=True).decode().lower()
+        output = probes.run("lspci").decode().lower()
         return ("nvidia" in output and "intel" in output)
     except:
         return False
@@ -43,7 +44,7 @@ def detect_nvidia_optimus():
 
 def detect_amd_apu():
     try:
-        output = subprocess.check_output("lspci", shell=True).decode().lower()
+        output = probes.run("lspci").decode().lower()
         # AMD APU = AMD GPU integrated into CPU, usually shows as "AMD graphics"
         return ("amd" in output and "graphics" in output and "radeon" not in output)
     except:
@@ -52,30 +53,44 @@ def detect_amd_apu():
 
 def detect_egpu():
     try:
-        output = subprocess.check_output("lsusb", shell=True).decode().lower()
+        output = probes.run("lsusb").decode().lower()
         # Thunderbolt + GPU vendor = likely eGPU
         return "thunderbolt" in output and ("nvidia" in output or "amd" in output)
     except:
         return False
 
 
+# ---------------------------------------------------------
+# Probes: one entry per top-level key of the scan
+# ---------------------------------------------------------
+PROBES = {
+    "gpu": scan_gpu,
+    "ram": scan_ram,
+    "storage": scan_storage,
+
+    # Phase 7 hardware intelligence
+    "is_laptop": detect_laptop,
+    "touchscreen": detect_touchscreen,
+    "hidpi": detect_hidpi,
+    "optimus": detect_nvidia_optimus,
+    "amd_apu": detect_amd_apu,
+    "egpu": detect_egpu
+}
+
+
 def full_scan():
-    return {
-        "gpu": {
-            "gpu_model": platform.uname().machine
-        },
-        "ram": {
-            "total_gb": round(psutil.virtual_memory().total / (1024**3), 2)
-        },
-        "storage": {
-            "type": "ssd"  # placeholder, can be improved later
-        },
-
-        # Phase 7 hardware intelligence
-        "is_laptop": detect_laptop(),
-        "touchscreen": detect_touchscreen(),
-        "hidpi": detect_hidpi(),
-        "optimus": detect_nvidia_optimus(),
-        "amd_apu": detect_amd_apu(),
-        "egpu": detect_egpu()
-    }
+    return {key: probe() for key, probe in PROBES.items()}
+
+
+# Runs every probe concurrently and yields (key, value) as each finishes,
+# fastest first. Probes still running after `timeout` seconds are dropped.
+def iter_scan(timeout: float = None):
+    pool = ThreadPoolExecutor(max_workers=len(PROBES))
+    futures = {pool.submit(probe): key for key, probe in PROBES.items()}
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            yield futures[future], future.result()
+    except TimeoutError:
+        pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -1,16 +1,14 @@
 import platform
-import subprocess
-import os
+from . import probes
 
 def scan_storage():
-    system = platform.system()
+    system = probes.call("platform.system", platform.system)
 
     # === Windows ===
     if system == "Windows":
         try:
-            output = subprocess.check_output(
-                "wmic diskdrive get Model,MediaType",
-                shell=True
+            output = probes.run(
+                "wmic diskdrive get Model,MediaType"
             ).decode(errors="ignore")
 
             if "SSD" in output.upper():
@@ -24,17 +22,16 @@ def scan_storage():
     # === Linux ===
     if system == "Linux":
         # Check NVMe
-        if os.path.exists("/sys/block/nvme0n1"):
+        if probes.path_exists("/sys/block/nvme0n1"):
             return {"type": "NVMe SSD"}
 
         # Check rotational flag
         try:
-            with open("/sys/block/sda/queue/rotational") as f:
-                rotational = f.read().strip()
-                if rotational == "0":
-                    return {"type": "SSD"}
-                else:
-                    return {"type": "HDD"}
+            rotational = probes.read_text("/sys/block/sda/queue/rotational").strip()
+            if rotational == "0":
+                return {"type": "SSD"}
+            else:
+                return {"type": "HDD"}
         except:
             return {"type": "Unknown"}
 
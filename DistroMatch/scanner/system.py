@@ -1,8 +1,9 @@
 import platform
+from . import probes
 
 def scan_system():
     return {
-        "os": platform.system(),
-        "os_version": platform.version(),
-        "machine": platform.machine()
+        "os": probes.call("platform.system", platform.system),
+        "os_version": probes.call("platform.version", platform.version),
+        "machine": probes.call("platform.machine", platform.machine)
     }
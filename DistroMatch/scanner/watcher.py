@@ -0,0 +1,209 @@
+import argparse
+import errno
+import json
+import select
+import signal
+import socket
+import time
+from .scanner import PROBES, full_scan
+
+NETLINK_KOBJECT_UEVENT = 15
+KERNEL_EVENTS_GROUP = 1
+RECV_BUFFER = 1 << 20
+
+# Kernel subsystem -> (actions that matter, scan keys to re-probe)
+# power_supply "change" fires on every battery tick, so only add/remove count.
+WATCHED_SUBSYSTEMS = {
+    "pci":          ({"add", "remove"}, ["gpu", "optimus", "amd_apu", "egpu"]),
+    "drm":          ({"add", "remove", "change"}, ["gpu", "hidpi", "optimus", "amd_apu", "egpu"]),
+    "thunderbolt":  ({"add", "remove"}, ["egpu"]),
+    "usb":          ({"add", "remove"}, ["egpu"]),
+    "input":        ({"add", "remove"}, ["touchscreen"]),
+    "block":        ({"add", "remove"}, ["storage"]),
+    "memory":       ({"online", "offline"}, ["ram"]),
+    "power_supply": ({"add", "remove"}, ["is_laptop"])
+}
+
+# Every key any watched subsystem can affect
+ALL_WATCHED_KEYS = {key for _, keys in WATCHED_SUBSYSTEMS.values() for key in keys}
+
+
+# ---------------------------------------------------------
+# Uevent Parsing
+# ---------------------------------------------------------
+# Kernel messages look like: b"add@/devices/...\0ACTION=add\0SUBSYSTEM=usb\0..."
+def parse_uevent(data: bytes) -> dict:
+    event = {}
+    for field in data.split(b"\0")[1:]:
+        key, sep, value = field.partition(b"=")
+        if sep:
+            event[key.decode(errors="ignore")] = value.decode(errors="ignore")
+    return event
+
+
+def affected_probes(event: dict) -> set:
+    actions, keys = WATCHED_SUBSYSTEMS.get(event.get("SUBSYSTEM", ""), (set(), []))
+    if event.get("ACTION") not in actions:
+        return set()
+    return set(keys)
+
+
+def open_uevent_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+    # A hotplug storm (dock, Thunderbolt chain) can overflow the default buffer
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER)
+    except OSError:
+        pass
+    sock.bind((0, KERNEL_EVENTS_GROUP))
+    return sock
+
+
+# ---------------------------------------------------------
+# Event-Driven Watcher
+# ---------------------------------------------------------
+# Keeps a cached scan (and optionally a recommendation) current by
+# re-probing only the detectors a kernel uevent can affect. The loop
+# blocks on the netlink socket, so nothing runs while hardware is idle.
+#
+# recommend: optional callable(scan) -> result, e.g.
+#     lambda hw: get_recommendations(hw, "Work", "Beginner")
+# on_change: optional callable(scan, changed_keys, recommendation)
+class HardwareWatcher:
+    def __init__(self, recommend=None, on_change=None, settle: float = 0.5):
+        self.recommend = recommend
+        self.on_change = on_change
+        self.settle = settle
+
+        self.scan = None
+        self.recommendation = None
+        self.sock = None
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._running = False
+
+    def start(self):
+        self.sock = open_uevent_socket()
+        self.scan = full_scan()
+        if self.recommend:
+            self.recommendation = self.recommend(self.scan)
+
+    # Re-probe the given keys; returns the keys whose value changed
+    def refresh(self, keys: set) -> set:
+        scan = dict(self.scan)
+        changed = set()
+
+        for key in keys:
+            value = PROBES[key]()
+            if value != scan.get(key):
+                scan[key] = value
+                changed.add(key)
+
+        if changed:
+            self.scan = scan
+            if self.recommend:
+                self.recommendation = self.recommend(scan)
+            if self.on_change:
+                self.on_change(scan, changed, self.recommendation)
+
+        return changed
+
+    def _read_events(self) -> set:
+        keys = set()
+        while True:
+            try:
+                data = self.sock.recv(65536, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                return keys
+            except OSError as e:
+                # The kernel dropped events; we can't tell which, so re-probe everything
+                if e.errno == errno.ENOBUFS:
+                    return set(ALL_WATCHED_KEYS)
+                raise
+            keys |= affected_probes(parse_uevent(data))
+
+    # Blocks until stop(); hotplug bursts are coalesced for `settle` seconds
+    def run(self):
+        if self.sock is None:
+            self.start()
+        self._running = True
+
+        while self._running:
+            ready, _, _ = select.select([self.sock, self._wake_r], [], [])
+            if self._wake_r in ready:
+                break
+
+            keys = self._read_events()
+            if not keys:
+                continue
+
+            deadline = time.monotonic() + self.settle
+            while (remaining := deadline - time.monotonic()) > 0:
+                ready, _, _ = select.select([self.sock, self._wake_r], [], [], remaining)
+                if self._wake_r in ready:
+                    self._running = False
+                    break
+                if ready:
+                    keys |= self._read_events()
+
+            self.refresh(keys)
+
+        self._running = False
+        self._drain_wake()
+
+    # Consume pending stop() bytes so a later run() doesn't exit at once
+    def _drain_wake(self):
+        while True:
+            try:
+                if not self._wake_r.recv(64, socket.MSG_DONTWAIT):
+                    return
+            except BlockingIOError:
+                return
+
+    def stop(self):
+        self._running = False
+        self._wake_w.send(b"\0")
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        self._wake_r.close()
+        self._wake_w.close()
+
+
+# ---------------------------------------------------------
+# CLI: daemon mode
+# ---------------------------------------------------------
+# Prints one JSON line per hardware change (changed keys + new top 3) until
+# interrupted or sent SIGTERM.
+def main():
+    from engine.ranking import get_recommendations
+
+    parser = argparse.ArgumentParser(description="Watch for hardware changes and keep recommendations current.")
+    parser.add_argument("--usecase", required=True)
+    parser.add_argument("--skill", required=True)
+    parser.add_argument("--settle", type=float, default=0.5)
+    args = parser.parse_args()
+
+    def report(scan, changed, recommendation):
+        print(json.dumps({"changed": sorted(changed), "top_3": recommendation["top_3"]}), flush=True)
+
+    watcher = HardwareWatcher(
+        recommend=lambda hw: get_recommendations(hw, args.usecase, args.skill),
+        on_change=report,
+        settle=args.settle
+    )
+    watcher.start()
+    report(watcher.scan, set(watcher.scan), watcher.recommendation)
+
+    signal.signal(signal.SIGTERM, lambda *_: watcher.stop())
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
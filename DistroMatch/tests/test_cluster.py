@@ -0,0 +1,80 @@
+import socket
+import threading
+import pytest
+from engine.cluster import (
+    run_cluster, start_local_workers, stop_local_workers, recv_message
+)
+from engine.ranking import get_recommendations
+
+MACHINES = {
+    f"m{i}": {
+        "gpu": {"gpu_model": ["NVIDIA RTX", "AMD Radeon", "Intel UHD"][i % 3]},
+        "ram": {"total_gb": [2, 4, 8, 16][i % 4]},
+        "storage": {"type": ["ssd", "hdd"][i % 2]},
+        "is_laptop": bool(i % 5 == 0)
+    }
+    for i in range(40)
+}
+
+
+def closed_port() -> tuple:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    address = sock.getsockname()
+    sock.close()
+    return address
+
+
+# Accepts one connection, reads one unit and hangs up without replying
+def dying_worker() -> tuple:
+    server = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        conn, _ = server.accept()
+        recv_message(conn)
+        conn.close()
+        server.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server.getsockname()
+
+
+@pytest.fixture(scope="module")
+def workers():
+    processes, addresses = start_local_workers(2)
+    yield addresses
+    stop_local_workers(processes, addresses)
+
+
+def test_matches_single_process(workers):
+    report = run_cluster(MACHINES, workers, "Work", "Beginner", unit_size=7)
+    assert report["results"] == {
+        m: get_recommendations(hw, "Work", "Beginner") for m, hw in MACHINES.items()
+    }
+    assert report["dead_workers"] == []
+
+
+def test_unreachable_worker_fails():
+    with pytest.raises(RuntimeError):
+        run_cluster(MACHINES, [closed_port()], "Gaming", "Beginner", timeout=5)
+
+
+def test_worker_dying_mid_unit_with_no_one_left():
+    with pytest.raises(RuntimeError):
+        run_cluster(MACHINES, [closed_port(), dying_worker()], "Gaming", "Beginner", timeout=5)
+
+
+def test_dead_worker_unit_is_retried(workers):
+    dying = dying_worker()
+    report = run_cluster(MACHINES, [dying] + workers, "Gaming", "Casual", unit_size=5)
+    assert report["results"] == {
+        m: get_recommendations(hw, "Gaming", "Casual") for m, hw in MACHINES.items()
+    }
+    # The dying worker may not win a unit before the others drain the queue
+    assert report["dead_workers"] in ([], [list(dying)])
+    assert report["retried"] == len(report["dead_workers"])
+
+
+def test_worker_error_is_raised(workers):
+    with pytest.raises(RuntimeError, match="Unknown filter"):
+        run_cluster(MACHINES, workers, "Gaming", "Beginner", filters={"bogus": 1})
@@ -0,0 +1,89 @@
+import copy
+import itertools
+import pytest
+from engine.catalog import Catalog
+from engine.impact import catalog_impact, diff_catalogs
+from engine.ranking import rank_distros
+from engine.scoring import load_distros, HARDWARE_FLAGS
+
+USECASE = "Gaming"
+SKILL = "Intermediate"
+
+
+def machines() -> dict:
+    inventory = {}
+    combos = itertools.product(
+        ["NVIDIA RTX", "AMD Radeon", "Intel UHD"], [2, 4, 8, 16], ["ssd", "hdd"], range(0, 64, 7)
+    )
+    for n, (gpu, ram, storage, flags) in enumerate(combos):
+        hardware = {"gpu": {"gpu_model": gpu}, "ram": {"total_gb": ram}, "storage": {"type": storage}}
+        for i, flag in enumerate(HARDWARE_FLAGS):
+            hardware[flag] = bool(flags >> i & 1)
+        inventory[f"m{n}"] = hardware
+    return inventory
+
+
+def top(hardware: dict, catalog: Catalog, top_k: int = 3) -> list:
+    return [
+        {"id": d["id"], "name": d["name"], "score": d["score"]}
+        for d in rank_distros(hardware, USECASE, SKILL, catalog=catalog)[:top_k]
+    ]
+
+
+def stored(old: dict, top_k: int = 3) -> dict:
+    catalog = Catalog(old)
+    return {m: {"hardware": hw, "top_3": top(hw, catalog, top_k)} for m, hw in machines().items()}
+
+
+def edits() -> list:
+    old = load_distros()
+    first, second = list(old)[:2]
+    gaming = next(k for k, d in old.items() if "gaming" in [c.lower() for c in d.get("category", [])])
+
+    boosted = copy.deepcopy(old)
+    boosted[gaming]["stability"] = 20
+
+    removed = copy.deepcopy(old)
+    del removed[gaming]
+
+    added = copy.deepcopy(old)
+    added["new_distro"] = dict(copy.deepcopy(old[gaming]), name="New Distro", performance=15)
+
+    reordered = {second: old[second], first: old[first]}
+    reordered.update({k: v for k, v in old.items() if k not in reordered})
+
+    return [("boosted", boosted), ("removed", removed), ("added", added), ("reordered", reordered)]
+
+
+@pytest.mark.parametrize("name,new", edits())
+def test_matches_full_rerun(name, new):
+    old = load_distros()
+    inventory = stored(old)
+    report = catalog_impact(old, new, inventory, USECASE, SKILL)
+
+    new_catalog = Catalog(new)
+    expected = {}
+    for machine_id, entry in inventory.items():
+        after = top(entry["hardware"], new_catalog)
+        if after != entry["top_3"]:
+            expected[machine_id] = {"before": entry["top_3"], "after": after}
+
+    assert report["changed_machines"] == expected
+    assert report["delta_scored"] + report["rescored"] == len(inventory)
+
+
+def test_diff_catalogs():
+    old = load_distros()
+    _, new = edits()[2]
+    assert diff_catalogs(old, new) == {"added": ["new_distro"], "removed": [], "changed": []}
+
+
+def test_short_stored_list_is_rescored():
+    old = load_distros()
+    inventory = stored(old, top_k=3)
+    report = catalog_impact(old, old, inventory, USECASE, SKILL, top_k=5)
+
+    catalog = Catalog(old)
+    assert report["rescored"] == len(inventory)
+    for machine_id, entry in inventory.items():
+        assert report["changed_machines"][machine_id]["after"] == top(entry["hardware"], catalog, 5)
@@ -0,0 +1,101 @@
+import copy
+import itertools
+import threading
+import pytest
+from engine.catalog import Catalog
+from engine.ranking import rank_distros
+from engine.scoring import load_distros
+from engine.shared_catalog import CatalogPublisher, SharedCatalog
+
+HARDWARE = [
+    {
+        "gpu": {"gpu_model": gpu},
+        "ram": {"total_gb": ram},
+        "storage": {"type": storage},
+        "is_laptop": laptop,
+        "hidpi": laptop,
+        "optimus": gpu.startswith("NVIDIA") and laptop
+    }
+    for gpu, ram, storage, laptop in itertools.product(
+        ["NVIDIA RTX", "AMD Radeon", "Intel UHD", "Unknown GPU"],
+        [1, 2, 4, 8, 16],
+        ["NVMe SSD", "HDD", "Unknown"],
+        [False, True]
+    )
+]
+
+
+def top(ranked: list) -> list:
+    return [{"id": d["id"], "name": d["name"], "score": d["score"]} for d in ranked[:3]]
+
+
+@pytest.fixture
+def shared(tmp_path):
+    publisher = CatalogPublisher(directory=str(tmp_path))
+    worker = SharedCatalog(directory=str(tmp_path))
+    yield publisher, worker
+    worker.close()
+    publisher.close()
+
+
+@pytest.mark.parametrize("usecase", ["Gaming", "Work", "Browsing", "browsing"])
+@pytest.mark.parametrize("skill_level", ["Beginner", "Advanced"])
+def test_rank_matches_rank_distros(shared, usecase, skill_level):
+    publisher, worker = shared
+    publisher.publish()
+    worker.refresh()
+    for hardware in HARDWARE:
+        assert worker.rank(hardware, usecase, skill_level) == top(
+            rank_distros(hardware, usecase, skill_level)
+        )
+
+
+def test_rank_before_publish_raises(tmp_path):
+    worker = SharedCatalog(directory=str(tmp_path))
+    assert worker.refresh() is False
+    with pytest.raises(RuntimeError):
+        worker.rank(HARDWARE[0], "Work", "Beginner")
+
+    # Attached before the publisher existed; picks up its first generation
+    publisher = CatalogPublisher(directory=str(tmp_path))
+    publisher.publish()
+    assert worker.rank(HARDWARE[0], "Work", "Beginner")
+    worker.close()
+    publisher.close()
+
+
+def test_generation_flip(shared):
+    publisher, worker = shared
+    hardware = HARDWARE[0]
+    publisher.publish()
+    assert worker.refresh() is True
+    assert worker.refresh() is False
+    before = worker.rank(hardware, "Work", "Beginner")
+
+    distros = copy.deepcopy(load_distros())
+    del distros[before[0]["id"]]
+    assert publisher.publish(Catalog(distros)) == 2
+
+    # Still serving the old generation until refresh()
+    assert worker.rank(hardware, "Work", "Beginner") == before
+    assert worker.refresh() is True
+    assert worker.generation == 2
+    assert worker.rank(hardware, "Work", "Beginner") == top(
+        rank_distros(hardware, "Work", "Beginner", catalog=Catalog(distros))
+    )
+
+
+def test_refresh_after_publisher_closed(shared):
+    publisher, worker = shared
+    publisher.publish()
+    worker.refresh()
+    publisher.publish()
+    publisher.close()
+
+    result = []
+    t = threading.Thread(target=lambda: result.append(worker.refresh()), daemon=True)
+    t.start()
+    t.join(5)
+    assert not t.is_alive(), "refresh() kept retrying a segment that no longer exists"
+    assert result == [False]
+    assert worker.rank(HARDWARE[0], "Work", "Beginner")